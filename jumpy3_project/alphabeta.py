@@ -12,7 +12,12 @@ import sys
 from jumpy3_utils import (
     read_board,
     write_board,
-    alphabeta,
+    board_to_string,
+    alphabeta_basic,
+    parallel_root_search,
+    ALPHABETA_PARALLEL_MIN_DEPTH,
+    INF,
+    NEG_INF,
     static_evaluation,
     white_win,
     black_win
@@ -30,11 +35,22 @@ def main():
     board = read_board(inputfile)
     positions_evaluated = [0]
 
-    eval_value, best_move = alphabeta(
-        board, depth, -float('inf'), float('inf'), True, static_evaluation, positions_evaluated
-    )
+    # Iterative deepening: every shallower search leaves its best moves in the
+    # transposition table, which orders the moves of the next, deeper search.
+    # A deep final iteration splits the root moves across processes; splitting
+    # every deep iteration would start a process pool per iteration.
+    for d in range(1, depth):
+        alphabeta_basic(board, d, NEG_INF, INF, True, static_evaluation, positions_evaluated)
+    if depth >= ALPHABETA_PARALLEL_MIN_DEPTH:
+        eval_value, best_move = parallel_root_search(
+            board, depth, alphabeta_basic, static_evaluation, positions_evaluated
+        )
+    else:
+        eval_value, best_move = alphabeta_basic(
+            board, depth, NEG_INF, INF, True, static_evaluation, positions_evaluated
+        )
 
-    print("Output board position:", ''.join(best_move))
+    print("Output board position:", board_to_string(best_move))
     print("Positions evaluated by static estimation:", positions_evaluated[0])
     print("ALPHA-BETA estimate:", eval_value)
 
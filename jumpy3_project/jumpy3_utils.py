@@ -3,14 +3,53 @@
 jumpy3_utils.py
 
 This module contains common functions for the Jumpy3 project:
-– Board I/O and representation (boards are lists of 16 characters)
+– Board I/O and representation (boards are packed into a single integer)
 – Move generation for White moves (and by flipping, for Black moves)
 – The static evaluation function (and an improved version)
 – Terminal tests (WhiteWin and BlackWin)
-– Minimax and AlphaBeta search functions
+– Minimax and AlphaBeta search functions (and a parallel root search)
 """
 
-import copy
+import functools
+import linecache
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# ----------------------------
+# Board representation
+# ----------------------------
+#
+# A board is a single int holding 16 squares of SQUARE_BITS bits each;
+# square i (0 = leftmost) lives in bits [SQUARE_BITS*i, SQUARE_BITS*(i+1)).
+# Children are produced by bit twiddling, so no board is ever copied.
+#
+# In every piece code bit 0 marks an occupied square and bit 1 is the colour
+# (set for Black), so swapping colours is a single XOR per occupied square.
+
+EMPTY = 0b0000
+WHITE_KING = 0b0001   # 'W'
+BLACK_KING = 0b0011   # 'B'
+WHITE_PIECE = 0b0101  # 'w'
+BLACK_PIECE = 0b0111  # 'b'
+
+SQUARE_BITS = 4
+SQUARE_MASK = (1 << SQUARE_BITS) - 1
+
+PIECE_CODES = {'x': EMPTY, 'W': WHITE_KING, 'w': WHITE_PIECE, 'B': BLACK_KING, 'b': BLACK_PIECE}
+PIECE_CHARS = {code: char for char, code in PIECE_CODES.items()}
+
+COLOUR_BIT = 0b0010
+OCCUPIED_BITS = 0x1111111111111111  # bit 0 of every square
+LOW_NIBBLES = 0x0F0F0F0F0F0F0F0F
+
+def pack_board(board):
+    """Pack a sequence of 16 piece characters into a board state."""
+    return sum(PIECE_CODES[c] << (SQUARE_BITS * i) for i, c in enumerate(board))
+
+def board_to_string(state):
+    """Return the 16-letter string form of a board state."""
+    return ''.join(PIECE_CHARS[(state >> (SQUARE_BITS * i)) & SQUARE_MASK] for i in range(16))
 
 # ----------------------------
 # Board I/O
@@ -18,36 +57,49 @@ import copy
 
 def read_board(filename):
     """Read a board position from file. Expect a file with 16 characters."""
-    with open(filename, 'r') as f:
-        content = f.read().strip()
-    # Assume file content is exactly 16 characters (possibly with spaces/newlines removed)
-    board = list(content.replace(" ", "").replace("\n", ""))
+    # Drop whitespace in a single pass; the remaining 16 characters are the squares.
+    board = [c for c in Path(filename).read_text() if c not in ' \n\r\t']
     if len(board) != 16:
         raise ValueError("Board must contain exactly 16 positions.")
-    return board
+    invalid = set(board) - PIECE_CODES.keys()
+    if invalid:
+        raise ValueError(f"Board contains invalid pieces: {''.join(sorted(invalid))} (expected x, W, w, B or b).")
+    return pack_board(board)
 
 def write_board(board, filename):
     """Write the board position to the given file as a string of 16 letters."""
-    with open(filename, 'w') as f:
-        f.write(''.join(board))
+    Path(filename).write_text(board_to_string(board))
 
 # ----------------------------
 # Utility: Flip the board
 # ----------------------------
 
+def flip_packed(board):
+    """
+    Flip a board state without looping over squares: reverse the order of the
+    16 four-bit squares, then toggle the colour bit of every occupied square.
+    """
+    # Swap the two squares inside each byte, then reverse the bytes.
+    board = ((board & LOW_NIBBLES) << 4) | ((board >> 4) & LOW_NIBBLES)
+    board = int.from_bytes(board.to_bytes(8, 'little'), 'big')
+    return board ^ ((board & OCCUPIED_BITS) << 1)
+
 def flip(board):
     """
     Flip the board by reversing the order and swapping White and Black pieces.
     Mapping: W <-> B, w <-> b; x remains x.
     """
-    mapping = {'W': 'B', 'w': 'b', 'B': 'W', 'b': 'w', 'x': 'x'}
-    flipped = [mapping[piece] for piece in board[::-1]]
-    return flipped
+    return flip_packed(board)
 
 # ----------------------------
 # Move generation for White
 # ----------------------------
 
+# Positions are revisited through transpositions and by every pass of
+# iterative deepening, so move lists are memoized per board state.
+MOVE_CACHE_SIZE = 200_000
+
+@functools.lru_cache(maxsize=MOVE_CACHE_SIZE)
 def generate_white_moves(board):
     """
     Generate all possible board positions after one white move.
@@ -61,85 +113,93 @@ def generate_white_moves(board):
                     if the jumped square (i+1) contains a black piece (b or B),
                     then “capture” it by moving that piece to the rightmost empty square.
                 - If jump length is greater than 2, no capture is made.
-    Each move is applied to a copy of the board.
+    Each move is a new board state built from the old one with bit operations.
+    Results are cached per position and returned as tuples, so they must not
+    be modified.
     """
     moves = []
-    for i, piece in enumerate(board):
-        if piece not in ['W', 'w']:
-            continue
-        new_board = copy.deepcopy(board)
-        if i == 15:
+    # Bit 0 of every empty square, and of every square holding a white piece.
+    empty = ~board & OCCUPIED_BITS
+    whites = board & ~(board >> 1) & OCCUPIED_BITS
+    while whites:
+        low = whites & -whites
+        whites ^= low
+        shift = low.bit_length() - 1  # SQUARE_BITS * i
+        piece = (board >> shift) & SQUARE_MASK
+        # Board with the moving piece lifted off square i.
+        vacated = board & ~(SQUARE_MASK << shift)
+        if shift == SQUARE_BITS * 15:
             # Move out of board.
-            new_board[i] = 'x'
-            moves.append(new_board)
-        elif new_board[i+1] == 'x':
+            moves.append(vacated)
+            continue
+        next_shift = shift + SQUARE_BITS
+        jumped_piece = (board >> next_shift) & SQUARE_MASK
+        if jumped_piece == EMPTY:
             # Simple one-step move.
-            new_board[i+1] = piece
-            new_board[i] = 'x'
-            moves.append(new_board)
-        else:
-            # Jump move.
-            # Find first empty square to the right of i
-            j = None
-            for idx in range(i+1, 16):
-                if new_board[idx] == 'x':
-                    j = idx
-                    break
-            if j is None:
-                # No empty square: piece jumps out.
-                new_board[i] = 'x'
-                moves.append(new_board)
-            else:
-                # Copy board and perform jump.
-                jump_board = copy.deepcopy(board)
-                jump_board[j] = piece
-                jump_board[i] = 'x'
-                # Check if jump is over a single piece.
-                if j - i == 2:
-                    # Determine if jumped piece is white.
-                    jumped_piece = board[i+1]
-                    if jumped_piece in ['W', 'w']:
-                        # Jump over own piece: no capture.
-                        moves.append(jump_board)
-                    else:
-                        # Jump over a black piece: capture it.
-                        # Find rightmost empty square.
-                        k = None
-                        for idx in range(15, -1, -1):
-                            if jump_board[idx] == 'x':
-                                k = idx
-                                break
-                        if k is not None:
-                            jump_board[k] = jumped_piece
-                        # Remove the jumped piece.
-                        jump_board[i+1] = 'x'
-                        moves.append(jump_board)
-                else:
-                    # Jump over several squares: no capture.
-                    moves.append(jump_board)
-    return moves
+            moves.append(vacated | (piece << next_shift))
+            continue
+        # Jump move.
+        # Find first empty square to the right of i (i+1 is occupied).
+        beyond = empty >> (next_shift + SQUARE_BITS) << (next_shift + SQUARE_BITS)
+        if not beyond:
+            # No empty square: piece jumps out.
+            moves.append(vacated)
+            continue
+        jump_shift = (beyond & -beyond).bit_length() - 1
+        jump_board = vacated | (piece << jump_shift)
+        if jump_shift == next_shift + SQUARE_BITS and jumped_piece & COLOUR_BIT:
+            # Jump over a single black piece: capture it by moving it to the
+            # rightmost empty square (square i was just vacated, so one exists).
+            rightmost_shift = (~jump_board & OCCUPIED_BITS).bit_length() - 1
+            jump_board = (jump_board & ~(SQUARE_MASK << next_shift)) | (jumped_piece << rightmost_shift)
+        moves.append(jump_board)
+    return tuple(moves)
 
+@functools.lru_cache(maxsize=MOVE_CACHE_SIZE)
 def generate_black_moves(board):
     """
     Generate moves for Black by flipping the board, generating white moves,
-    and then flipping the results back.
+    and then flipping the results back. Cached like generate_white_moves.
     """
-    flipped = flip(board)
+    flipped = flip_packed(board)
     white_moves_on_flipped = generate_white_moves(flipped)
-    black_moves = [flip(b) for b in white_moves_on_flipped]
+    black_moves = tuple(flip_packed(b) for b in white_moves_on_flipped)
     return black_moves
 
+def count_white_moves(board):
+    """
+    Count White's moves without generating them. Every white piece has exactly
+    one move (a step, a jump or moving off the board), so this is the number
+    of occupied squares whose colour bit is clear.
+    """
+    return (board & ~(board >> 1) & OCCUPIED_BITS).bit_count()
+
+def count_black_moves(board):
+    """Count Black's moves: the number of squares holding a black piece."""
+    return (board & (board >> 1) & OCCUPIED_BITS).bit_count()
+
 # ----------------------------
 # Terminal conditions and static evaluation
 # ----------------------------
 
+# Kings are the piece codes with bit 2 clear. The masks below keep bit 0 of
+# every matching square; a square's index is the mask bit's bit_length() >> 2.
+
+def white_king_squares(board):
+    """Return a mask marking the squares that hold the White king."""
+    return board & ~((board >> 1) | (board >> 2)) & OCCUPIED_BITS
+
+def black_king_squares(board):
+    """Return a mask marking the squares that hold the Black king."""
+    return board & (board >> 1) & ~(board >> 2) & OCCUPIED_BITS
+
 def white_win(board):
     """White wins if the board does not contain White king 'W'."""
-    return 'W' not in board
+    return not white_king_squares(board)
 
 def black_win(board):
     """Black wins if the board does not contain Black king 'B'."""
-    return 'B' not in board
+    return not black_king_squares(board)
 
 def static_evaluation(board):
     """
@@ -148,21 +208,19 @@ def static_evaluation(board):
        If Black wins, return -100;
        Otherwise, let i be the index of White king (W) and j the index of Black king (B),
        and return (i + j - 15).
+    Both kings are located from one pair of masks instead of scanning the board.
     """
-    if white_win(board):
+    kings = board & ~(board >> 2) & OCCUPIED_BITS
+    colours = board >> 1
+    white = kings & ~colours
+    if not white:
         return 100
-    if black_win(board):
+    black = kings & colours
+    if not black:
         return -100
-    try:
-        i = board.index('W')
-    except ValueError:
-        # Should not occur if game is not terminal.
-        i = 16
-    try:
-        j = board.index('B')
-    except ValueError:
-        j = -1
-    return i + j - 15
+    return ((white & -white).bit_length() >> 2) + ((black & -black).bit_length() >> 2) - 15
+
+IMPROVED_EVAL_SCALE = 10
 
 def improved_static_evaluation(board):
     """
@@ -172,29 +230,175 @@ def improved_static_evaluation(board):
     The evaluation is defined as:
          evaluation = (i + j - 15) + 0.1 * (num_white_moves - num_black_moves)
     Terminal positions are evaluated the same as before.
+    The result is returned in tenths (multiplied by IMPROVED_EVAL_SCALE) so that
+    it stays an integer; divide by IMPROVED_EVAL_SCALE to report it.
     """
-    if white_win(board):
-        return 100
-    if black_win(board):
-        return -100
-    try:
-        i = board.index('W')
-    except ValueError:
-        i = 16
-    try:
-        j = board.index('B')
-    except ValueError:
-        j = -1
-    basic_eval = i + j - 15
-    num_white_moves = len(generate_white_moves(board))
-    num_black_moves = len(generate_black_moves(board))
-    mobility_bonus = 0.1 * (num_white_moves - num_black_moves)
-    return basic_eval + mobility_bonus
+    kings = board & ~(board >> 2) & OCCUPIED_BITS
+    colours = board >> 1
+    white = kings & ~colours
+    if not white:
+        return 100 * IMPROVED_EVAL_SCALE
+    black = kings & colours
+    if not black:
+        return -100 * IMPROVED_EVAL_SCALE
+    basic_eval = ((white & -white).bit_length() >> 2) + ((black & -black).bit_length() >> 2) - 15
+    num_white_moves = count_white_moves(board)
+    num_black_moves = count_black_moves(board)
+    mobility_bonus = num_white_moves - num_black_moves
+    return IMPROVED_EVAL_SCALE * basic_eval + mobility_bonus
+
+# ----------------------------
+# Transposition table
+# ----------------------------
+#
+# Jumpy3 positions are often reached through different move orders, so both
+# searches remember what they learned about a position and side to move.
+# The packed board is already an exact, collision-free dict key; the side to
+# move is folded in as one extra bit above the 16 squares.
+# Entries are (depth, value, flag, best_move) tuples, one table per
+# evaluation function so scores from different evaluations never mix.
+
+EXACT = 0  # value is the minimax value of the position
+LOWER = 1  # value is a lower bound (the search failed high)
+UPPER = 2  # value is an upper bound (the search failed low)
+
+BLACK_TO_MOVE = 1 << (SQUARE_BITS * 16)
+TT_MAX_ENTRIES = 1_000_000
+
+_transposition_tables = {}
+
+def transposition_table(eval_fn):
+    """Return the transposition table used for searches with eval_fn."""
+    table = _transposition_tables.get(eval_fn)
+    if table is None:
+        table = _transposition_tables[eval_fn] = {}
+    return table
+
+def clear_transposition_tables():
+    """Forget every stored search result."""
+    _transposition_tables.clear()
+
+def bound_flag(value, alpha, beta):
+    """Return the flag for a value found by searching with the window (alpha, beta)."""
+    if value <= alpha:
+        return UPPER
+    if value >= beta:
+        return LOWER
+    return EXACT
+
+def store_transposition(table, key, depth, value, flag, best_move):
+    """
+    Store a search result, preferring results from deeper searches.
+    Once the table holds TT_MAX_ENTRIES positions, new positions are dropped.
+    A stored value is only reused by a search of the same depth: a deeper
+    result would let a fixed-depth search see past its horizon, which changes
+    the value it reports.
+    """
+    entry = table.get(key)
+    if entry is None:
+        if len(table) >= TT_MAX_ENTRIES:
+            return
+    elif entry[0] > depth:
+        return
+    table[key] = (depth, value, flag, best_move)
+
+# ----------------------------
+# Move ordering
+# ----------------------------
+#
+# Alpha-beta prunes the most when the best move is searched first. Each node
+# tries the transposition table's best move first, then the "killer" moves
+# that caused a cutoff at the same ply elsewhere in the tree, then the rest
+# by their history score: the sum of depth * depth over every cutoff the move
+# has caused anywhere in the tree.
+
+MAX_PLY = 64
+
+killer_moves = [[None, None] for _ in range(MAX_PLY)]
+history = {}
+
+def move_key(board, new_board):
+    """
+    Identify a move independently of the rest of the board: the XOR of the two
+    positions only keeps the squares (and pieces) the move touched.
+    """
+    return board ^ new_board
+
+def record_cutoff(ply, depth, key):
+    """
+    Note that the move with the given key caused a cutoff at this ply with
+    depth plies left: make it the newest killer and raise its history score.
+    """
+    if ply < MAX_PLY:
+        killers = killer_moves[ply]
+        if killers[0] != key:
+            killers[1] = killers[0]
+            killers[0] = key
+    history[key] = history.get(key, 0) + depth * depth
+
+def clear_move_ordering():
+    """Forget all killer moves and history scores."""
+    for killers in killer_moves:
+        killers[0] = killers[1] = None
+    history.clear()
+
+# Sort keys that put the transposition table move, then the killers, ahead
+# of every history score.
+TT_MOVE_PRIORITY = 1 << 64
+KILLER_PRIORITY = 1 << 62
+
+def order_moves(board, moves, ply, tt_move, out):
+    """
+    Copy moves into the list out (reusing it rather than allocating a new
+    list) and sort it in place: the transposition table move first, then any
+    killer moves for this ply, then the rest by history score. The sort is
+    stable, so ties keep generation order. Returns out.
+    """
+    out[:] = moves
+    first, second = killer_moves[ply] if ply < MAX_PLY else (None, None)
+    if tt_move is None and first is None and not history:
+        return out
+    scores = history.get
+
+    def priority(move):
+        if move == tt_move:
+            return TT_MOVE_PRIORITY
+        key = board ^ move
+        if key == first:
+            return KILLER_PRIORITY + 1
+        if key == second:
+            return KILLER_PRIORITY
+        return scores(key, 0)
+
+    out.sort(key=priority, reverse=True)
+    return out
 
 # ----------------------------
 # Minimax and AlphaBeta search routines
 # ----------------------------
 
+# Evaluations are integers, so integer sentinels keep every comparison in the
+# search on the int fast path.
+INF = 10**9
+NEG_INF = -INF
+
+# Both searches are written as negamax: a node's value is scored from the
+# point of view of the side to move (color 1 for White, -1 for Black), so a
+# child's value is simply negated instead of having separate max and min
+# branches. Transposition table entries use the same convention. The public
+# functions still take is_white_turn and return White's point of view.
+#
+# Both searches walk the tree with an explicit stack of per-ply frames instead
+# of recursing, so descending into a node costs no Python function call.
+# The locals (board, depth, ...) always describe the node being entered or
+# resumed; each frame saves them for a node whose children are being searched.
+
+def generate_moves(board, color):
+    """Generate the moves of the side to move: White if color is 1, Black if -1."""
+    if color == 1:
+        return generate_white_moves(board)
+    return generate_black_moves(board)
+
 def minimax(board, depth, is_white_turn, eval_fn, positions_evaluated):
     """
     Minimax search.
@@ -209,33 +413,70 @@ def minimax(board, depth, is_white_turn, eval_fn, positions_evaluated):
     Returns:
       (best_eval, best_move)
     """
-    # Terminal node: if game is over or depth==0, evaluate.
-    if depth == 0 or white_win(board) or black_win(board):
-        positions_evaluated[0] += 1
-        return eval_fn(board), board
+    table = transposition_table(eval_fn)
+    root_color = color = 1 if is_white_turn else -1
+    # Frames: [board, depth, color, key, moves, idx, best_eval, best_move]
+    stack = []
+    # Reused by every frontier node for its leaf values.
+    values = []
+    while True:
+        # Enter the node.
+        if depth == 0 or white_win(board) or black_win(board):
+            # Terminal node: if game is over or depth==0, evaluate.
+            positions_evaluated[0] += 1
+            result, result_move = color * eval_fn(board), board
+        else:
+            # Only exact values are usable without an alpha-beta window, and
+            # only from a search of the same depth (see store_transposition).
+            key = board if color == 1 else board | BLACK_TO_MOVE
+            entry = table.get(key)
+            if entry is not None and entry[0] == depth and entry[2] == EXACT:
+                result, result_move = entry[1], entry[3]
+            else:
+                moves = generate_moves(board, color)
+                if depth == 1:
+                    # Frontier node: every child is a leaf, so evaluate them
+                    # all in one pass instead of pushing a frame per leaf.
+                    values[:] = map(eval_fn, moves)
+                    positions_evaluated[0] += len(values)
+                    best = max(values) if color == 1 else min(values)
+                    result, result_move = color * best, moves[values.index(best)]
+                    store_transposition(table, key, depth, result, EXACT, result_move)
+                else:
+                    stack.append([board, depth, color, key, moves, 0, NEG_INF, None])
+                    board = moves[0]
+                    depth -= 1
+                    color = -color
+                    continue
 
-    if is_white_turn:
-        best_eval = -float('inf')
-        best_move = None
-        moves = generate_white_moves(board)
-        for move in moves:
-            eval_value, _ = minimax(move, depth - 1, False, eval_fn, positions_evaluated)
-            if eval_value > best_eval:
-                best_eval = eval_value
-                best_move = move
-        return best_eval, best_move
-    else:
-        best_eval = float('inf')
-        best_move = None
-        moves = generate_black_moves(board)
-        for move in moves:
-            eval_value, _ = minimax(move, depth - 1, True, eval_fn, positions_evaluated)
-            if eval_value < best_eval:
-                best_eval = eval_value
-                best_move = move
-        return best_eval, best_move
+        # Back the result up through every frame it completes.
+        while stack:
+            frame = stack[-1]
+            board, depth, color, key, moves, idx, best_eval, best_move = frame
+            if -result > best_eval:
+                best_eval = -result
+                best_move = moves[idx]
+            idx += 1
+            if idx < len(moves):
+                frame[5:] = idx, best_eval, best_move
+                board = moves[idx]
+                depth -= 1
+                color = -color
+                break
+            stack.pop()
+            store_transposition(table, key, depth, best_eval, EXACT, best_move)
+            result, result_move = best_eval, best_move
+        else:
+            return root_color * result, result_move
+
+# alphabeta is generated from a source template so that copies specialized
+# to one evaluation function can be built from the same code: in
+# alphabeta_basic and alphabeta_improved the terminal test and the evaluation
+# are written into the loop body, which saves a Python call for every leaf and
+# reads the king masks once per position.
 
-def alphabeta(board, depth, alpha, beta, is_white_turn, eval_fn, positions_evaluated):
+_ALPHABETA_TEMPLATE = '''
+def {name}(board, depth, alpha, beta, is_white_turn, eval_fn, positions_evaluated, ply=0):
     """
     Alpha-Beta pruning search.
     
@@ -247,37 +488,244 @@ def alphabeta(board, depth, alpha, beta, is_white_turn, eval_fn, positions_evalu
       is_white_turn: True if maximizing (White), False if minimizing (Black).
       eval_fn: static evaluation function.
       positions_evaluated: a list with one element for counting evaluations.
+      ply: distance from the root, used to look up killer moves.
       
     Returns:
       (best_eval, best_move)
+    {leaves}
     """
-    if depth == 0 or white_win(board) or black_win(board):
-        positions_evaluated[0] += 1
-        return eval_fn(board), board
+{check}    table = transposition_table({table_eval})
+    root_ply = ply
+    root_color = color = 1 if is_white_turn else -1
+    if color == -1:
+        alpha, beta = -beta, -alpha
+    # Frames: [board, depth, alpha, beta, color, key, alpha_orig,
+    #          moves, idx, best_eval, best_move]
+    stack = []
+    # One reusable move list per stack level, owned by this call. A level's
+    # list is only refilled once the node using it, and everything below it,
+    # has been finished.
+    move_buffers = [[] for _ in range(depth)]
+    while True:
+        # Enter the node.
+        result = None
+{enter_setup}        if depth == 0 or {game_over}:
+            positions_evaluated[0] += 1
+            result, result_move = color * {enter_eval}, board
+        else:
+            key = board if color == 1 else board | BLACK_TO_MOVE
+            entry = table.get(key)
+            tt_move = None
+            if entry is not None:
+                entry_depth, entry_eval, flag, tt_move = entry
+                # The best move orders the search whatever its depth, but the
+                # value only stands in for a search of exactly this depth.
+                if entry_depth == depth:
+                    if flag == EXACT:
+                        result, result_move = entry_eval, tt_move
+                    else:
+                        if flag == LOWER:
+                            alpha = max(alpha, entry_eval)
+                        else:
+                            beta = min(beta, entry_eval)
+                        if alpha >= beta:
+                            result, result_move = entry_eval, tt_move
+            if result is None:
+                ply = root_ply + len(stack)
+                moves = order_moves(board, generate_moves(board, color), ply, tt_move,
+                                    move_buffers[len(stack)])
+                if depth > 1:
+                    stack.append([board, depth, alpha, beta, color, key, alpha,
+                                  moves, 0, NEG_INF, None])
+                    board = moves[0]
+                    depth -= 1
+                    alpha, beta = -beta, -alpha
+                    color = -color
+                    continue
+                # Frontier node: every child is a leaf, so evaluate them in one
+                # tight loop instead of pushing a frame per leaf.
+                alpha_orig = alpha
+                result = NEG_INF
+                for move in moves:
+                    positions_evaluated[0] += 1
+{frontier_setup}                    value = color * {frontier_eval}
+                    if value > result:
+                        result = value
+                        result_move = move
+                    alpha = max(alpha, result)
+                    if alpha >= beta:
+                        record_cutoff(ply, depth, move_key(board, move))
+                        break
+                store_transposition(table, key, depth, result, bound_flag(result, alpha_orig, beta), result_move)
 
-    if is_white_turn:
-        best_eval = -float('inf')
-        best_move = None
-        moves = generate_white_moves(board)
-        for move in moves:
-            eval_value, _ = alphabeta(move, depth - 1, alpha, beta, False, eval_fn, positions_evaluated)
-            if eval_value > best_eval:
-                best_eval = eval_value
+        # Back the result up through every frame it completes.
+        while stack:
+            frame = stack[-1]
+            (board, depth, alpha, beta, color, key, alpha_orig,
+             moves, idx, best_eval, best_move) = frame
+            move = moves[idx]
+            if -result > best_eval:
+                best_eval = -result
                 best_move = move
             alpha = max(alpha, best_eval)
-            if beta <= alpha:
-                break  # Beta cutoff
-        return best_eval, best_move
+            idx += 1
+            if alpha >= beta:
+                record_cutoff(root_ply + len(stack) - 1, depth, move_key(board, move))
+            elif idx < len(moves):
+                frame[2] = alpha
+                frame[8:] = idx, best_eval, best_move
+                board = moves[idx]
+                depth -= 1
+                alpha, beta = -beta, -alpha
+                color = -color
+                break
+            stack.pop()
+            store_transposition(table, key, depth, best_eval, bound_flag(best_eval, alpha_orig, beta), best_move)
+            result, result_move = best_eval, best_move
+        else:
+            return root_color * result, result_move
+'''
+
+# Source snippets for the inlined evaluations; {board} names the position.
+
+_KING_MASKS = (
+    "colours = {board} >> 1\n"
+    "kings = {board} & ~({board} >> 2) & OCCUPIED_BITS\n"
+    "white = kings & ~colours\n"
+    "black = kings & colours\n"
+)
+
+# static_evaluation as an expression over the _KING_MASKS names.
+_BASIC_EVAL_SOURCE = (
+    "(100 if not white else -100 if not black else "
+    "((white & -white).bit_length() >> 2) + ((black & -black).bit_length() >> 2) - 15)"
+)
+
+# improved_static_evaluation as an expression over the _KING_MASKS names.
+_IMPROVED_EVAL_SOURCE = (
+    "(100 * IMPROVED_EVAL_SCALE if not white else -100 * IMPROVED_EVAL_SCALE if not black else "
+    "IMPROVED_EVAL_SCALE * (((white & -white).bit_length() >> 2) + ((black & -black).bit_length() >> 2) - 15) "
+    "+ ({board} & ~colours & OCCUPIED_BITS).bit_count() - ({board} & colours & OCCUPIED_BITS).bit_count())"
+)
+
+def _indent(lines, spaces):
+    return ''.join(' ' * spaces + line + '\n' for line in lines.splitlines())
+
+def _build_alphabeta(name, eval_name=None, eval_source=None):
+    """
+    Compile a copy of alphabeta. With eval_source, leaves are scored by that
+    expression inlined in the loop, and the copy only accepts eval_name as its
+    eval_fn; otherwise they are scored by calling eval_fn.
+    """
+    if eval_source is None:
+        fields = dict(
+            leaves="Leaves are scored by calling eval_fn.",
+            check="",
+            table_eval="eval_fn",
+            enter_setup="",
+            game_over="white_win(board) or black_win(board)",
+            enter_eval="eval_fn(board)",
+            frontier_setup="",
+            frontier_eval="eval_fn(move)",
+        )
     else:
-        best_eval = float('inf')
-        best_move = None
-        moves = generate_black_moves(board)
-        for move in moves:
-            eval_value, _ = alphabeta(move, depth - 1, alpha, beta, True, eval_fn, positions_evaluated)
-            if eval_value < best_eval:
-                best_eval = eval_value
-                best_move = move
-            beta = min(beta, best_eval)
-            if beta <= alpha:
-                break  # Alpha cutoff
-        return best_eval, best_move
+        fields = dict(
+            leaves=f"Leaves are scored by an inlined {eval_name}; eval_fn must be {eval_name}.",
+            # eval_fn stays in the signature so the variants can be passed
+            # wherever alphabeta is (e.g. to parallel_root_search).
+            check=_indent(
+                f"if eval_fn is not {eval_name}:\n"
+                f"    raise ValueError('{name} only evaluates with {eval_name}')", 4),
+            table_eval=eval_name,
+            enter_setup=_indent(_KING_MASKS.format(board="board"), 8),
+            game_over="not white or not black",
+            enter_eval=eval_source.format(board="board"),
+            frontier_setup=_indent(_KING_MASKS.format(board="move"), 20),
+            frontier_eval=eval_source.format(board="move"),
+        )
+    source = _ALPHABETA_TEMPLATE.format(name=name, **fields)
+    filename = f"<jumpy3_utils.{name}>"
+    # Register the source so tracebacks through the generated code show it.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = {}
+    exec(compile(source, filename, 'exec'), globals(), namespace)
+    return namespace[name]
+
+alphabeta = _build_alphabeta('alphabeta')
+alphabeta_basic = _build_alphabeta('alphabeta_basic', 'static_evaluation', _BASIC_EVAL_SOURCE)
+alphabeta_improved = _build_alphabeta('alphabeta_improved', 'improved_static_evaluation', _IMPROVED_EVAL_SOURCE)
+
+# ----------------------------
+# Parallel root search
+# ----------------------------
+#
+# White's root moves lead to independent subtrees, so they can be searched in
+# separate processes (threads would serialize on the GIL). Starting a process
+# pool costs far more than a shallow search, so the command-line programs
+# only split the root once per run (for iterative deepening, the final
+# iteration), and only from a depth where the search clearly outweighs the
+# pool. Starting four workers takes about 10 ms with fork and 350 ms with
+# spawn; for comparison, minimax takes 0.5-0.9 s at depth 10 on board1/board2,
+# while alpha-beta's final iteration takes 10-20 ms at depth 10, 0.3-0.7 s at
+# depth 16 and about 2 s at depth 18.
+
+MINIMAX_PARALLEL_MIN_DEPTH = 10
+ALPHABETA_PARALLEL_MIN_DEPTH = 18
+
+def _search_root_move(job):
+    """Search one root move in a worker process. Returns (value, positions evaluated)."""
+    search, move, depth, alpha, eval_fn = job
+    positions_evaluated = [0]
+    if search is minimax:
+        value, _ = minimax(move, depth, False, eval_fn, positions_evaluated)
+    else:
+        value, _ = search(move, depth, alpha, INF, False, eval_fn, positions_evaluated, 1)
+    return value, positions_evaluated[0]
+
+def parallel_root_search(board, depth, search, eval_fn, positions_evaluated, max_workers=None):
+    """
+    Search the position for White with search (minimax or one of the alphabeta
+    variants), giving each root move to a worker process.
+    With alpha-beta the first root move is searched here before the others are
+    started, so its value can serve as their alpha bound (Young Brothers Wait).
+    Where worker processes are forked, they start from a copy of this
+    process's tables, so earlier searches still order their moves. With a
+    single worker (max_workers, or by default the number of CPUs) the whole
+    search runs here instead.
+    
+    Returns:
+      (best_eval, best_move)
+    """
+    if depth == 0 or white_win(board) or black_win(board):
+        positions_evaluated[0] += 1
+        return eval_fn(board), board
+
+    if (max_workers or os.cpu_count() or 1) <= 1:
+        if search is minimax:
+            return minimax(board, depth, True, eval_fn, positions_evaluated)
+        return search(board, depth, NEG_INF, INF, True, eval_fn, positions_evaluated)
+
+    table = transposition_table(eval_fn)
+    moves = generate_white_moves(board)
+    values = []
+    alpha = NEG_INF
+    if search is not minimax:
+        # Take the root moves in the order the sequential alpha-beta would,
+        # so that equal values resolve to the same move.
+        entry = table.get(board)
+        moves = order_moves(board, moves, 0, entry[3] if entry is not None else None, [])
+        alpha, _ = search(moves[0], depth - 1, alpha, INF, False, eval_fn, positions_evaluated, 1)
+        values.append(alpha)
+    jobs = [(search, move, depth - 1, alpha, eval_fn) for move in moves[len(values):]]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for value, count in executor.map(_search_root_move, jobs):
+            values.append(value)
+            positions_evaluated[0] += count
+
+    # Ties go to the earliest move in search order, as in the sequential
+    # searches: a move searched with the first move's value as alpha returns
+    # either its exact value or a bound no higher than that value.
+    best_eval = max(values)
+    best_move = moves[values.index(best_eval)]
+    store_transposition(table, board, depth, best_eval, EXACT, best_move)
+    return best_eval, best_move
@@ -14,7 +14,10 @@ import sys
 from jumpy3_utils import (
     read_board,
     write_board,
+    board_to_string,
     minimax,
+    parallel_root_search,
+    MINIMAX_PARALLEL_MIN_DEPTH,
     static_evaluation,
     generate_white_moves,
     white_win,
@@ -38,18 +41,23 @@ def main():
         print("\n Debug: Generated White Moves from input position:")
         moves = generate_white_moves(board)
         for idx, m in enumerate(moves):
-            move_str = ''.join(m)
+            move_str = board_to_string(m)
             eval_val = static_evaluation(m)
             print(f"Move {idx+1}: {move_str} | Eval: {eval_val}")
         print()
 
-    # Run MiniMax algorithm
+    # Run MiniMax algorithm (deep searches split the root moves across processes)
     positions_evaluated = [0]
-    eval_value, best_move = minimax(board, depth, True, static_evaluation, positions_evaluated)
+    if depth >= MINIMAX_PARALLEL_MIN_DEPTH:
+        eval_value, best_move = parallel_root_search(
+            board, depth, minimax, static_evaluation, positions_evaluated
+        )
+    else:
+        eval_value, best_move = minimax(board, depth, True, static_evaluation, positions_evaluated)
 
     # 🗞 Output results
     if not quiet:
-        print("Output board position:", ''.join(best_move))
+        print("Output board position:", board_to_string(best_move))
         print("Positions evaluated by static estimation:", positions_evaluated[0])
         print("MINIMAX estimate:", eval_value)
         manual_eval = static_evaluation(best_move)
@@ -4,16 +4,23 @@ minimaxblack.py
 
 This program plays a move for Black using the minimax algorithm.
 It computes Black’s move by flipping the board, generating white moves, and flipping back.
+The search uses alpha-beta pruning, which finds the same value as plain minimax;
+pass --algorithm minimax to run the unpruned search instead.
 Usage:
-    python minimaxblack.py inputfile.txt outputfile.txt depth
+    python minimaxblack.py inputfile.txt outputfile.txt depth [--algorithm minimax|alphabeta]
 Example:
     python minimaxblack.py board1.txt board2.txt 2
+    python minimaxblack.py board1.txt board2.txt 4 --algorithm minimax
 """
 import sys
 from jumpy3_utils import (
     read_board,
     write_board,
+    board_to_string,
     minimax,
+    alphabeta_basic,
+    INF,
+    NEG_INF,
     flip,
     static_evaluation,
     white_win,
@@ -21,13 +28,16 @@ from jumpy3_utils import (
 )
 
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python minimaxblack.py inputfile.txt outputfile.txt depth")
+    if len(sys.argv) not in (4, 6) or (
+        len(sys.argv) == 6 and (sys.argv[4] != "--algorithm" or sys.argv[5] not in ("minimax", "alphabeta"))
+    ):
+        print("Usage: python minimaxblack.py inputfile.txt outputfile.txt depth [--algorithm minimax|alphabeta]")
         sys.exit(1)
 
     inputfile = sys.argv[1]
     outputfile = sys.argv[2]
     depth = int(sys.argv[3])
+    algorithm = sys.argv[5] if len(sys.argv) == 6 else "alphabeta"
 
     board = read_board(inputfile)
 
@@ -35,15 +45,21 @@ def main():
     flipped_board = flip(board)
     positions_evaluated = [0]
 
-    # Run minimax pretending it's White's turn on the flipped board
-    eval_value, best_move_flipped = minimax(flipped_board, depth, True, static_evaluation, positions_evaluated)
+    # Run the search pretending it's White's turn on the flipped board
+    if algorithm == "alphabeta":
+        eval_value, best_move_flipped = alphabeta_basic(
+            flipped_board, depth, NEG_INF, INF, True, static_evaluation, positions_evaluated
+        )
+    else:
+        eval_value, best_move_flipped = minimax(flipped_board, depth, True, static_evaluation, positions_evaluated)
 
     # Flip the move back to Black's perspective
     best_move = flip(best_move_flipped)
 
-    print("Output board position:", ''.join(best_move))
+    print("Output board position:", board_to_string(best_move))
     print("Positions evaluated by static estimation:", positions_evaluated[0])
-    print("MINIMAX estimate (for Black move):", eval_value)
+    label = "ALPHA-BETA" if algorithm == "alphabeta" else "MINIMAX"
+    print(f"{label} estimate (for Black move):", eval_value)
 
     # Sanity check: manual evaluation of result
     manual_eval = static_evaluation(best_move)
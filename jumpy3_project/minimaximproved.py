@@ -4,10 +4,13 @@ minimaximproved.py
 
 This program plays a move for White using the minimax algorithm with an improved static evaluation.
 The improved evaluation function adds a mobility bonus (the difference in number of legal moves).
+The search uses alpha-beta pruning, which finds the same value as plain minimax;
+pass --algorithm minimax to run the unpruned search instead.
 Usage:
-    python minimaximproved.py inputfile.txt outputfile.txt depth
+    python minimaximproved.py inputfile.txt outputfile.txt depth [--algorithm minimax|alphabeta]
 Example:
     python minimaximproved.py board1.txt board2.txt 2
+    python minimaximproved.py board1.txt board2.txt 4 --algorithm minimax
 
 Explanation of improvement:
     In addition to the basic evaluation (which considers the positions of the kings),
@@ -19,31 +22,54 @@ import sys
 from jumpy3_utils import (
     read_board,
     write_board,
+    board_to_string,
     minimax,
+    alphabeta_improved,
+    INF,
+    NEG_INF,
     improved_static_evaluation,
+    IMPROVED_EVAL_SCALE,
     white_win,
     black_win
 )
 
+def report_value(value):
+    """
+    Convert an improved evaluation (in tenths) back to the documented units.
+    Terminal scores are whole numbers and print as 100 / -100, as before.
+    """
+    if abs(value) == 100 * IMPROVED_EVAL_SCALE:
+        return value // IMPROVED_EVAL_SCALE
+    return value / IMPROVED_EVAL_SCALE
+
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python minimaximproved.py inputfile.txt outputfile.txt depth")
+    if len(sys.argv) not in (4, 6) or (
+        len(sys.argv) == 6 and (sys.argv[4] != "--algorithm" or sys.argv[5] not in ("minimax", "alphabeta"))
+    ):
+        print("Usage: python minimaximproved.py inputfile.txt outputfile.txt depth [--algorithm minimax|alphabeta]")
         sys.exit(1)
 
     inputfile = sys.argv[1]
     outputfile = sys.argv[2]
     depth = int(sys.argv[3])
+    algorithm = sys.argv[5] if len(sys.argv) == 6 else "alphabeta"
 
     board = read_board(inputfile)
     positions_evaluated = [0]
-    eval_value, best_move = minimax(board, depth, True, improved_static_evaluation, positions_evaluated)
+    if algorithm == "alphabeta":
+        eval_value, best_move = alphabeta_improved(
+            board, depth, NEG_INF, INF, True, improved_static_evaluation, positions_evaluated
+        )
+    else:
+        eval_value, best_move = minimax(board, depth, True, improved_static_evaluation, positions_evaluated)
 
-    print("Output board position:", ''.join(best_move))
+    print("Output board position:", board_to_string(best_move))
     print("Positions evaluated by static estimation:", positions_evaluated[0])
-    print("MINIMAX (improved) estimate:", eval_value)
+    label = "ALPHA-BETA" if algorithm == "alphabeta" else "MINIMAX"
+    print(f"{label} (improved) estimate:", report_value(eval_value))
 
     # Manual evaluation check
-    manual_eval = improved_static_evaluation(best_move)
+    manual_eval = report_value(improved_static_evaluation(best_move))
     print("Manual static eval of best move:", manual_eval)
 
     # Winner detection
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+test_jumpy3_utils.py
+
+Regression tests for jumpy3_utils. The packed board functions are checked
+against a straightforward list-of-characters implementation of the rules
+(the original representation) on random positions.
+Run with:
+    python -m unittest test_jumpy3_utils
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from jumpy3_utils import (
+    pack_board,
+    read_board,
+    board_to_string,
+    flip,
+    generate_white_moves,
+    generate_black_moves,
+    count_white_moves,
+    count_black_moves,
+    white_win,
+    black_win,
+    static_evaluation,
+    improved_static_evaluation,
+    IMPROVED_EVAL_SCALE,
+    minimax,
+    alphabeta,
+    alphabeta_basic,
+    alphabeta_improved,
+    clear_transposition_tables,
+    clear_move_ordering,
+    transposition_table,
+    parallel_root_search,
+    EXACT,
+    INF,
+    NEG_INF,
+)
+
+# ----------------------------
+# Reference implementation (boards are lists of 16 characters)
+# ----------------------------
+
+def ref_flip(board):
+    mapping = {'W': 'B', 'w': 'b', 'B': 'W', 'b': 'w', 'x': 'x'}
+    return [mapping[piece] for piece in board[::-1]]
+
+def ref_white_moves(board):
+    moves = []
+    for i, piece in enumerate(board):
+        if piece not in ('W', 'w'):
+            continue
+        new_board = list(board)
+        new_board[i] = 'x'
+        if i == 15:
+            moves.append(new_board)
+        elif board[i + 1] == 'x':
+            new_board[i + 1] = piece
+            moves.append(new_board)
+        else:
+            empties = [idx for idx in range(i + 1, 16) if board[idx] == 'x']
+            if not empties:
+                moves.append(new_board)
+                continue
+            j = empties[0]
+            new_board[j] = piece
+            jumped_piece = board[i + 1]
+            if j - i == 2 and jumped_piece in ('B', 'b'):
+                k = max(idx for idx in range(16) if new_board[idx] == 'x')
+                new_board[k] = jumped_piece
+                new_board[i + 1] = 'x'
+            moves.append(new_board)
+    return moves
+
+def ref_black_moves(board):
+    return [ref_flip(b) for b in ref_white_moves(ref_flip(board))]
+
+def ref_static_evaluation(board):
+    if 'W' not in board:
+        return 100
+    if 'B' not in board:
+        return -100
+    return board.index('W') + board.index('B') - 15
+
+def ref_improved_static_evaluation(board):
+    """The improved evaluation in tenths, to compare exactly with the packed version."""
+    if 'W' not in board:
+        return 100 * IMPROVED_EVAL_SCALE
+    if 'B' not in board:
+        return -100 * IMPROVED_EVAL_SCALE
+    mobility = len(ref_white_moves(board)) - len(ref_black_moves(board))
+    return IMPROVED_EVAL_SCALE * ref_static_evaluation(board) + mobility
+
+def ref_alphabeta(board, depth, alpha, beta, is_white_turn, eval_fn):
+    """Plain fixed-depth alpha-beta value, without any tables."""
+    if depth == 0 or 'W' not in board or 'B' not in board:
+        return eval_fn(board)
+    moves = ref_white_moves(board) if is_white_turn else ref_black_moves(board)
+    if is_white_turn:
+        for move in moves:
+            alpha = max(alpha, ref_alphabeta(move, depth - 1, alpha, beta, False, eval_fn))
+            if alpha >= beta:
+                break
+        return alpha
+    for move in moves:
+        beta = min(beta, ref_alphabeta(move, depth - 1, alpha, beta, True, eval_fn))
+        if alpha >= beta:
+            break
+    return beta
+
+def random_boards(count, seed=0):
+    """Positions from random play out of the start position, plus random piece placements."""
+    rnd = random.Random(seed)
+    boards = []
+    for n in range(count):
+        if n % 2 == 0:
+            board = list('WwwwxxxxxxxxbbbB')
+            for ply in range(rnd.randint(0, 20)):
+                if 'W' not in board or 'B' not in board:
+                    break
+                moves = ref_white_moves(board) if ply % 2 == 0 else ref_black_moves(board)
+                board = rnd.choice(moves)
+        else:
+            board = [rnd.choice('xxxxwb') for _ in range(16)]
+            for square, king in zip(rnd.sample(range(16), 2), 'WB'):
+                if rnd.random() < 0.9:
+                    board[square] = king
+        boards.append(board)
+    return boards
+
+BOARDS = random_boards(2000)
+
+def unpack(state):
+    return list(board_to_string(state))
+
+class PackedBoardTest(unittest.TestCase):
+
+    def test_pack_round_trip(self):
+        for board in BOARDS:
+            self.assertEqual(unpack(pack_board(board)), board)
+
+    def test_read_board(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'board.txt'
+            path.write_text('Wwww xxxx\nxxxx bbbB\n')
+            self.assertEqual(read_board(path), pack_board('WwwwxxxxxxxxbbbB'))
+            for text in ('WwwwxxxxxxxxbbbX', 'WwwwxxxxxxxxbbB'):
+                path.write_text(text)
+                with self.assertRaises(ValueError):
+                    read_board(path)
+
+    def test_flip(self):
+        for board in BOARDS:
+            self.assertEqual(unpack(flip(pack_board(board))), ref_flip(board))
+
+    def test_white_moves(self):
+        for board in BOARDS:
+            moves = generate_white_moves(pack_board(board))
+            self.assertEqual([unpack(m) for m in moves], ref_white_moves(board), board)
+            self.assertEqual(count_white_moves(pack_board(board)), len(moves))
+
+    def test_black_moves(self):
+        for board in BOARDS:
+            moves = generate_black_moves(pack_board(board))
+            self.assertEqual([unpack(m) for m in moves], ref_black_moves(board), board)
+            self.assertEqual(count_black_moves(pack_board(board)), len(moves))
+
+    def test_wins(self):
+        for board in BOARDS:
+            state = pack_board(board)
+            self.assertEqual(white_win(state), 'W' not in board)
+            self.assertEqual(black_win(state), 'B' not in board)
+
+    def test_static_evaluation(self):
+        for board in BOARDS:
+            self.assertEqual(static_evaluation(pack_board(board)), ref_static_evaluation(board), board)
+
+    def test_improved_static_evaluation(self):
+        for board in BOARDS:
+            self.assertEqual(improved_static_evaluation(pack_board(board)),
+                             ref_improved_static_evaluation(board), board)
+
+class SearchTest(unittest.TestCase):
+
+    SEARCH_BOARDS = [board for board in BOARDS[:120] if 'W' in board and 'B' in board]
+
+    def setUp(self):
+        clear_transposition_tables()
+        clear_move_ordering()
+
+    def test_search_values(self):
+        for board in self.SEARCH_BOARDS:
+            for depth in range(1, 5):
+                clear_transposition_tables()
+                for is_white_turn in (True, False):
+                    expected = ref_alphabeta(board, depth, NEG_INF, INF, is_white_turn, ref_static_evaluation)
+                    state = pack_board(board)
+                    value, _ = minimax(state, depth, is_white_turn, static_evaluation, [0])
+                    self.assertEqual(value, expected, (board, depth, is_white_turn))
+                    value, _ = alphabeta(state, depth, NEG_INF, INF, is_white_turn, static_evaluation, [0])
+                    self.assertEqual(value, expected, (board, depth, is_white_turn))
+
+    def test_tables_kept_between_depths(self):
+        # Iterative deepening leaves deep results in the tables that a later,
+        # shallower search of the same positions must not reuse.
+        for board in self.SEARCH_BOARDS:
+            state = pack_board(board)
+            for depth in (1, 2, 3, 4, 5, 6, 3, 2, 1):
+                expected = ref_alphabeta(board, depth, NEG_INF, INF, True, ref_static_evaluation)
+                value, _ = alphabeta(state, depth, NEG_INF, INF, True, static_evaluation, [0])
+                self.assertEqual(value, expected, (board, depth))
+                value, _ = minimax(state, depth, True, static_evaluation, [0])
+                self.assertEqual(value, expected, (board, depth))
+
+    def test_nested_searches(self):
+        # Every call owns its move lists, so a search started from inside
+        # another (here from its evaluation function) must not disturb it.
+        def searching_evaluation(state):
+            alphabeta_basic(state, 2, NEG_INF, INF, False, static_evaluation, [0])
+            return static_evaluation(state)
+
+        for board in self.SEARCH_BOARDS[:20]:
+            expected = ref_alphabeta(board, 4, NEG_INF, INF, True, ref_static_evaluation)
+            value, _ = alphabeta(pack_board(board), 4, NEG_INF, INF, True, searching_evaluation, [0])
+            self.assertEqual(value, expected, board)
+
+    def test_inlined_evaluations(self):
+        # Depth 0 scores the root and depth 1 the frontier, both inlined.
+        specialized = ((alphabeta_basic, static_evaluation), (alphabeta_improved, improved_static_evaluation))
+        for search, eval_fn in specialized:
+            for board in BOARDS:
+                state = pack_board(board)
+                value, _ = search(state, 0, NEG_INF, INF, True, eval_fn, [0])
+                self.assertEqual(value, eval_fn(state), board)
+                for is_white_turn in (True, False):
+                    clear_transposition_tables()
+                    expected = alphabeta(state, 1, NEG_INF, INF, is_white_turn, eval_fn, [0])
+                    clear_transposition_tables()
+                    self.assertEqual(search(state, 1, NEG_INF, INF, is_white_turn, eval_fn, [0]), expected, board)
+
+    def test_specialized_search_matches_alphabeta(self):
+        specialized = ((alphabeta_basic, static_evaluation), (alphabeta_improved, improved_static_evaluation))
+        for search, eval_fn in specialized:
+            for board in self.SEARCH_BOARDS:
+                state = pack_board(board)
+                for depth in range(2, 6):
+                    clear_transposition_tables()
+                    clear_move_ordering()
+                    expected_count = [0]
+                    expected = alphabeta(state, depth, NEG_INF, INF, True, eval_fn, expected_count)
+                    clear_transposition_tables()
+                    clear_move_ordering()
+                    count = [0]
+                    self.assertEqual(search(state, depth, NEG_INF, INF, True, eval_fn, count), expected)
+                    self.assertEqual(count, expected_count)
+
+    def test_specialized_search_rejects_other_eval_fn(self):
+        state = pack_board('WwwwxxxxxxxxbbbB')
+        with self.assertRaises(ValueError):
+            alphabeta_basic(state, 2, NEG_INF, INF, True, improved_static_evaluation, [0])
+        with self.assertRaises(ValueError):
+            alphabeta_improved(state, 2, NEG_INF, INF, True, static_evaluation, [0])
+
+    def test_parallel_root_search_matches_sequential(self):
+        searches = (
+            (minimax, static_evaluation),
+            (alphabeta, static_evaluation),
+            (alphabeta_basic, static_evaluation),
+            (alphabeta_improved, improved_static_evaluation),
+        )
+
+        def deepen(search, state, depth, eval_fn):
+            # Start each run from the tables the shallower passes of
+            # alphabeta.py leave behind, so the root ordering is exercised.
+            clear_transposition_tables()
+            clear_move_ordering()
+            if search is not minimax:
+                for d in range(1, depth):
+                    search(state, d, NEG_INF, INF, True, eval_fn, [0])
+
+        for search, eval_fn in searches:
+            for board in self.SEARCH_BOARDS[:8]:
+                state = pack_board(board)
+                for depth in (1, 3, 4):
+                    deepen(search, state, depth, eval_fn)
+                    if search is minimax:
+                        expected = minimax(state, depth, True, eval_fn, [0])
+                    else:
+                        expected = search(state, depth, NEG_INF, INF, True, eval_fn, [0])
+                    for max_workers in (1, 2):
+                        deepen(search, state, depth, eval_fn)
+                        result = parallel_root_search(state, depth, search, eval_fn, [0], max_workers)
+                        self.assertEqual(result, expected, (search.__name__, board, depth, max_workers))
+                        self.assertEqual(transposition_table(eval_fn)[state],
+                                         (depth, expected[0], EXACT, expected[1]))
+
+    def test_board1_depth_12(self):
+        # A deep search used to take values from deeper transposition entries.
+        state = pack_board('WwwwxxxxxxxxbbbB')
+        for depth in range(1, 13):
+            value, _ = alphabeta(state, depth, NEG_INF, INF, True, static_evaluation, [0])
+        self.assertEqual(value, -1)
+
+if __name__ == "__main__":
+    unittest.main()